@@ -10,7 +10,7 @@ import re
 import subprocess
 import time
 import urllib
-from functools import reduce
+from functools import lru_cache, reduce
 
 try:
     from attrs import asdict, define, evolve, field, frozen, validators
@@ -43,6 +43,13 @@ import urllib3.response
 from requests_kerberos import HTTPKerberosAuth
 
 HTTP_STATUS_CODES_OK = [200, 201]
+URL_SCHEME_PATTERN = re.compile(r'^https?://')
+# API URL of a new request printed by 'testing-farm request'
+TF_REQUEST_API_PATTERN = re.compile(r'api (https://\S*)')
+
+# Jira fields needed to evaluate issues found by IssueHandler.get_related_issues().
+# Using a comma-separated string on purpose, python-jira would modify a list in place.
+JIRA_RELATED_ISSUE_FIELDS = 'description,parent,status'
 
 if TYPE_CHECKING:
     from typing import ClassVar
@@ -99,6 +106,25 @@ def default_template_environment() -> jinja2.Environment:
     return environment
 
 
+# shared environment used by render_template() when no environment is given
+DEFAULT_TEMPLATE_ENVIRONMENT = default_template_environment()
+
+
+@lru_cache(maxsize=1024)
+def compile_template(template: str, environment: jinja2.Environment) -> jinja2.Template:
+    """
+    Compile a template in a given environment.
+
+    Compiled templates are cached, the same templates are rendered over and over
+    again for each artifact job.
+
+    :param template: template to compile.
+    :param environment: Jinja2 environment to use.
+    """
+
+    return environment.from_string(template)
+
+
 def render_template(
         template: str,
         environment: Optional[jinja2.Environment] = None,
@@ -112,10 +138,16 @@ def render_template(
     :param variables: variables to pass to the template.
     """
 
-    environment = environment or default_template_environment()
+    environment = environment or DEFAULT_TEMPLATE_ENVIRONMENT
+
+    # plain strings without any Jinja markup render to themselves
+    if (environment.variable_start_string not in template
+            and environment.block_start_string not in template
+            and environment.comment_start_string not in template):
+        return template.strip()
 
     try:
-        return environment.from_string(template).render(**variables).strip()
+        return compile_template(template, environment).render(**variables).strip()
 
     except jinja2.exceptions.TemplateSyntaxError as exc:
         raise Exception(
@@ -354,6 +386,45 @@ def post_request(
     raise Exception(f"POST request to {url} failed")
 
 
+def _test_compose(obj: Union[Event, ArtifactJob]) -> bool:
+    if isinstance(obj, Event):
+        return obj.type_ is EventType.COMPOSE
+
+    if isinstance(obj, ArtifactJob):
+        return obj.event.type_ is EventType.COMPOSE
+
+    raise Exception(f"Unsupported type in 'compose' test: {type(obj)}")
+
+
+def _test_erratum(obj: Union[Event, ArtifactJob]) -> bool:
+    if isinstance(obj, Event):
+        return obj.type_ is EventType.ERRATUM
+
+    if isinstance(obj, ArtifactJob):
+        return obj.event.type_ is EventType.ERRATUM
+
+    raise Exception(f"Unsupported type in 'erratum' test: {type(obj)}")
+
+
+def _test_match(s: str, pattern: str) -> bool:
+    return re.match(pattern, s) is not None
+
+
+def add_template_tests(environment: jinja2.Environment) -> jinja2.Environment:
+    """ Register NEWA specific Jinja2 tests in a given environment """
+
+    environment.tests['compose'] = _test_compose
+    environment.tests['erratum'] = _test_erratum
+    environment.tests['match'] = _test_match
+
+    return environment
+
+
+# shared environment used by eval_test() when no environment is given,
+# keeping it stable lets compile_template() reuse compiled expressions
+TEST_TEMPLATE_ENVIRONMENT = add_template_tests(default_template_environment())
+
+
 def eval_test(
         test: str,
         environment: Optional[jinja2.Environment] = None,
@@ -368,32 +439,10 @@ def eval_test(
     :returns: whether the expression evaluated to true-ish value.
     """
 
-    environment = environment or default_template_environment()
-
-    def _test_compose(obj: Union[Event, ArtifactJob]) -> bool:
-        if isinstance(obj, Event):
-            return obj.type_ is EventType.COMPOSE
-
-        if isinstance(obj, ArtifactJob):
-            return obj.event.type_ is EventType.COMPOSE
-
-        raise Exception(f"Unsupported type in 'compose' test: {type(obj)}")
-
-    def _test_erratum(obj: Union[Event, ArtifactJob]) -> bool:
-        if isinstance(obj, Event):
-            return obj.type_ is EventType.ERRATUM
-
-        if isinstance(obj, ArtifactJob):
-            return obj.event.type_ is EventType.ERRATUM
-
-        raise Exception(f"Unsupported type in 'erratum' test: {type(obj)}")
-
-    def _test_match(s: str, pattern: str) -> bool:
-        return re.match(pattern, s) is not None
-
-    environment.tests['compose'] = _test_compose
-    environment.tests['erratum'] = _test_erratum
-    environment.tests['match'] = _test_match
+    if environment:
+        add_template_tests(environment)
+    else:
+        environment = TEST_TEMPLATE_ENVIRONMENT
 
     try:
         outcome = render_template(
@@ -412,6 +461,19 @@ def get_url_basename(url: str) -> str:
     return os.path.basename(urllib.parse.urlparse(url).path)
 
 
+@lru_cache(maxsize=16)
+def get_jira_browse_url(jira_url: str) -> str:
+    """ Return URL of Jira issue pages, an issue URL is this URL followed by the issue key """
+    return urllib.parse.urljoin(jira_url, '/browse/')
+
+
+@lru_cache(maxsize=64)
+def parse_transition(transition: str) -> tuple[str, Optional[str]]:
+    """ Parse Jira transition 'status' or 'status.resolution' into a tuple (status, resolution) """
+    status, sep, resolution = transition.partition('.')
+    return (status, resolution) if sep else (status, None)
+
+
 class EventType(Enum):
     """ Event types """
 
@@ -434,18 +496,21 @@ class Arch(Enum):
     def architectures(cls: type[Arch],
                       preset: Optional[list[Arch]] = None) -> list[Arch]:
 
-        _exclude = [Arch.MULTI, Arch.SRPMS, Arch.NOARCH]
-        _all = [Arch(a) for a in Arch.__members__.values() if a not in _exclude]
-
         if not preset:
-            return _all
+            return list(DEFAULT_ARCHITECTURES)
         # 'noarch' should be tested on all architectures
-        if Arch('noarch') in preset:
-            return _all
+        if Arch.NOARCH in preset:
+            return list(DEFAULT_ARCHITECTURES)
         # 'multi' is given for container advisories
-        if Arch('multi') in preset:
-            return _all
-        return list(set(_all).intersection(set(preset)))
+        if Arch.MULTI in preset:
+            return list(DEFAULT_ARCHITECTURES)
+        return list(set(DEFAULT_ARCHITECTURES).intersection(preset))
+
+
+# architectures returned by Arch.architectures() when no specific arch is requested,
+# computed once as the Arch enum never changes
+DEFAULT_ARCHITECTURES = tuple(
+    a for a in Arch if a not in (Arch.MULTI, Arch.SRPMS, Arch.NOARCH))
 
 
 @define
@@ -989,7 +1054,7 @@ class Request(Cloneable, Serializable):
     def initiate_tf_request(self, ctx: CLIContext) -> TFRequest:
         command, environment = self.generate_tf_exec_command(ctx)
         # extend current envvars with the ones from the generated command
-        env = copy.deepcopy(os.environ)
+        env = os.environ.copy()
         env.update(environment)
         # disable colors and escape control sequences
         env['NO_COLOR'] = "1"
@@ -1008,7 +1073,7 @@ class Request(Cloneable, Serializable):
             output = process.stdout
         except subprocess.CalledProcessError as e:
             output = e.stdout
-        r = re.search('api (https://[\\S]*)', output)
+        r = TF_REQUEST_API_PATTERN.search(output)
         if not r:
             raise Exception(f"TF request failed:\n{output}\n")
         api = r.group(1).strip()
@@ -1025,7 +1090,7 @@ class TFRequest(Cloneable, Serializable):
     details: Optional[dict[str, Any]] = None
 
     def cancel(self, ctx: CLIContext) -> None:
-        env = copy.deepcopy(os.environ)
+        env = os.environ.copy()
         # disable colors and escape control sequences
         env['NO_COLOR'] = "1"
         env['NO_TTY'] = "1"
@@ -1258,13 +1323,14 @@ class IssueAction(Serializable):  # type: ignore[no-untyped-def]
         for attr_name in dir(defaults):
             attr = getattr(defaults, attr_name)
             if attr and (not attr_name.startswith('_') or callable(attr)):
+                # values are strings, numbers, enums or lists of those, so copying
+                # lists is enough to keep actions independent of the defaults
                 if attr_name == 'fields' and defaults.fields:
-                    if self.fields:
-                        self.fields = copy.deepcopy({**defaults.fields, **self.fields})
-                    else:
-                        setattr(self, attr_name, copy.deepcopy(defaults.fields))
+                    self.fields = {
+                        k: list(v) if isinstance(v, list) else v
+                        for k, v in {**defaults.fields, **(self.fields or {})}.items()}
                 elif not getattr(self, attr_name, None):
-                    setattr(self, attr_name, copy.deepcopy(attr))
+                    setattr(self, attr_name, copy.copy(attr))
         return
 
 
@@ -1291,6 +1357,9 @@ class IssueConfig(Serializable):  # type: ignore[no-untyped-def]
     @classmethod
     def from_yaml_with_include(cls: type[IssueConfig], location: str) -> IssueConfig:
 
+        # one parser instance serves all included files
+        yaml = yaml_parser()
+
         def load_data_from_location(location: str,
                                     stack: Optional[list[str]] = None) -> dict[str, Any]:
             if stack and location in stack:
@@ -1301,13 +1370,13 @@ class IssueConfig(Serializable):  # type: ignore[no-untyped-def]
             else:
                 stack = [location]
             data: dict[str, Any] = {}
-            if re.search('^https?://', location):
-                data = yaml_parser().load(get_request(
+            if URL_SCHEME_PATTERN.match(location):
+                data = yaml.load(get_request(
                     url=location,
                     response_content=ResponseContentType.TEXT))
             else:
                 try:
-                    data = yaml_parser().load(Path(location).read_text())
+                    data = yaml.load(Path(location).read_text())
                 except ruamel.yaml.error.YAMLError as e:
                     raise Exception(
                         f'Unable to load and parse YAML file from location {location}') from e
@@ -1318,6 +1387,8 @@ class IssueConfig(Serializable):  # type: ignore[no-untyped-def]
                 # drop 'include' so it won't be processed again
                 del data['include']
                 # processing files in reversed order so that later definition takes priority
+                # included data is freshly parsed and not used elsewhere, so it can be
+                # moved into data without copying
                 for loc in reversed(locations):
                     included_data = load_data_from_location(loc, stack)
                     if included_data:
@@ -1328,25 +1399,25 @@ class IssueConfig(Serializable):  # type: ignore[no-untyped-def]
                                 if key in data:
                                     data[key].extend(included_data[key])
                                 else:
-                                    data[key] = copy.deepcopy(included_data[key])
+                                    data[key] = included_data[key]
                             # special handing of 'defaults'
                             elif key == 'defaults':
                                 if key not in data:
-                                    data[key] = copy.deepcopy(included_data[key])
+                                    data[key] = included_data[key]
                                 else:
                                     for (k, v) in included_data[key].items():
                                         if k not in data[key]:
-                                            data[key][k] = copy.deepcopy(v)
+                                            data[key][k] = v
                                         else:
                                             # 'fields' we extend, original values having priority
                                             if k == 'fields':
                                                 # entend fields configuration
-                                                data[key][k] = copy.deepcopy(
-                                                    {**included_data[key][k], **data[key][k]})
+                                                data[key][k] = {
+                                                    **included_data[key][k], **data[key][k]}
                                             # other defined keys are not modified
                             else:
                                 if key not in data:
-                                    data[key] = copy.deepcopy(included_data[key])
+                                    data[key] = included_data[key]
 
             return data
 
@@ -1465,11 +1536,11 @@ class IssueHandler:  # type: ignore[no-untyped-def]
 
         return self.user_names[assignee_email]
 
-    def get_details(self, issue: Issue) -> jira.Issue:
-        """ Return issue details """
+    def get_details(self, issue: Issue, fields: Optional[str] = None) -> jira.Issue:
+        """ Return issue details, optionally limited to comma-separated Jira fields """
 
         try:
-            return self.connection.issue(issue.id)
+            return self.connection.issue(issue.id, fields=fields)
         except jira.JIRAError as e:
             raise Exception(f"Jira issue {issue} not found!") from e
 
@@ -1499,8 +1570,6 @@ class IssueHandler:  # type: ignore[no-untyped-def]
         }
         """
 
-        fields = ["description", "parent", "status"]
-
         newa_description = f"{self.newa_id(action, True) if all_respins else self.newa_id(action)}"
         if closed:
             query = \
@@ -1513,7 +1582,8 @@ class IssueHandler:  # type: ignore[no-untyped-def]
                 f"labels in ({IssueHandler.newa_label}) AND " + \
                 f"description ~ '{newa_description}' AND " + \
                 f"status not in ({','.join(self.transitions.closed)})"
-        search_result = self.connection.search_issues(query, fields=fields, json_result=True)
+        search_result = self.connection.search_issues(
+            query, fields=JIRA_RELATED_ISSUE_FIELDS, json_result=True)
         if not isinstance(search_result, dict):
             raise Exception(f"Unexpected search result type {type(search_result)}!")
 
@@ -1575,13 +1645,14 @@ class IssueHandler:  # type: ignore[no-untyped-def]
 
         try:
             jira_issue = self.connection.create_issue(data)
-            if fields is None:
-                fields = {}
-            # always add NEWA label to fields
-            if "Labels" in fields and isinstance(fields['Labels'], list):
-                fields['Labels'].append(IssueHandler.newa_label)
+            fields = fields or {}
+            # always add NEWA label to fields, the passed fields are shared
+            # with the issue config action and must not be modified
+            labels = fields.get('Labels')
+            if isinstance(labels, list):
+                fields = {**fields, 'Labels': [*labels, IssueHandler.newa_label]}
             else:
-                fields['Labels'] = [IssueHandler.newa_label]
+                fields = {**fields, 'Labels': [IssueHandler.newa_label]}
             # populate fdata with configuration provided by the user
             fdata: dict[str, str | float | list[Any]] = {}
             for field in fields:
@@ -1615,7 +1686,7 @@ class IssueHandler:  # type: ignore[no-untyped-def]
             return Issue(jira_issue.key,
                          group=self.group,
                          summary=summary,
-                         url=urllib.parse.urljoin(self.url, f'/browse/{jira_issue.key}'),
+                         url=f'{get_jira_browse_url(self.url)}{jira_issue.key}',
                          transition_passed=transition_passed,
                          transition_processed=transition_processed)
         except jira.JIRAError as e:
@@ -1625,11 +1696,13 @@ class IssueHandler:  # type: ignore[no-untyped-def]
         """ Update NEWA identifier of issue.
             Returns True when the issue had been 'adopted' by NEWA."""
 
-        issue_details = self.get_details(issue)
+        issue_details = self.get_details(issue, fields='description,labels')
         description = issue_details.fields.description
         labels = issue_details.fields.labels
         new_description = ""
         return_value = False
+        newa_id_prefix = self.newa_id()
+        action_newa_id = self.newa_id(action)
 
         # add NEWA label if missing
         if self.newa_label not in labels:
@@ -1637,18 +1710,19 @@ class IssueHandler:  # type: ignore[no-untyped-def]
             return_value = True
 
         # Issue does not have any NEWA ID yet
-        if isinstance(description, str) and self.newa_id() not in description:
-            new_description = f"{self.newa_id(action)}\n{description}"
+        if isinstance(description, str) and newa_id_prefix not in description:
+            new_description = f"{action_newa_id}\n{description}"
             return_value = True
 
         # Issue has NEWA ID but not the current respin - update it.
-        elif isinstance(description, str) and self.newa_id(action) not in description:
-            new_description = re.sub(f"^{re.escape(self.newa_id())}.*\n",
-                                     f"{self.newa_id(action)}\n", description)
+        elif isinstance(description, str) and action_newa_id not in description:
+            new_description = re.sub(f"^{re.escape(newa_id_prefix)}.*\n",
+                                     f"{action_newa_id}\n", description)
 
         if new_description:
             try:
-                self.get_details(issue).update(fields={"description": new_description})
+                # issue_details is reloaded by python-jira after each update, no need to fetch it
+                issue_details.update(fields={"description": new_description})
                 self.comment_issue(
                     issue, "NEWA refreshed issue ID.")
             except jira.JIRAError as e:
@@ -1681,15 +1755,15 @@ class IssueHandler:  # type: ignore[no-untyped-def]
                         'value': self.group} if self.group else None,
                     })
             # if the transition has a format status.resolution close with resolution
-            if '.' in self.transitions.dropped[0]:
-                status, resolution = self.transitions.dropped[0].split('.', 1)
+            status, resolution = parse_transition(self.transitions.dropped[0])
+            if resolution is not None:
                 self.connection.transition_issue(issue.id,
                                                  transition=status,
                                                  resolution={'name': resolution})
             # otherwise close just using the status
             else:
                 self.connection.transition_issue(issue.id,
-                                                 transition=self.transitions.dropped[0])
+                                                 transition=status)
         except jira.JIRAError as e:
             raise Exception(f"Cannot close issue {issue}!") from e
 
@@ -1844,10 +1918,7 @@ class CLIContext:
         return erratum
 
     def load_initial_errata(self, filename_prefix: str) -> Iterator[InitialErratum]:
-        for child in self.state_dirpath.iterdir():
-            if not child.name.startswith(filename_prefix):
-                continue
-
+        for child in self.state_dirpath.glob(f'{filename_prefix}*'):
             yield self.load_initial_erratum(child.resolve())
 
     def load_artifact_job(self, filepath: Path) -> ArtifactJob:
@@ -1858,10 +1929,7 @@ class CLIContext:
         return job
 
     def load_artifact_jobs(self, filename_prefix: str) -> Iterator[ArtifactJob]:
-        for child in self.state_dirpath.iterdir():
-            if not child.name.startswith(filename_prefix):
-                continue
-
+        for child in self.state_dirpath.glob(f'{filename_prefix}*'):
             yield self.load_artifact_job(child.resolve())
 
     def load_jira_job(self, filepath: Path) -> JiraJob:
@@ -1872,10 +1940,7 @@ class CLIContext:
         return job
 
     def load_jira_jobs(self, filename_prefix: str) -> Iterator[JiraJob]:
-        for child in self.state_dirpath.iterdir():
-            if not child.name.startswith(filename_prefix):
-                continue
-
+        for child in self.state_dirpath.glob(f'{filename_prefix}*'):
             yield self.load_jira_job(child.resolve())
 
     def load_schedule_job(self, filepath: Path) -> ScheduleJob:
@@ -1886,10 +1951,7 @@ class CLIContext:
         return job
 
     def load_schedule_jobs(self, filename_prefix: str) -> Iterator[ScheduleJob]:
-        for child in self.state_dirpath.iterdir():
-            if not child.name.startswith(filename_prefix):
-                continue
-
+        for child in self.state_dirpath.glob(f'{filename_prefix}*'):
             yield self.load_schedule_job(child.resolve())
 
     def load_execute_job(self, filepath: Path) -> ExecuteJob:
@@ -1900,10 +1962,7 @@ class CLIContext:
         return job
 
     def load_execute_jobs(self, filename_prefix: str) -> Iterator[ExecuteJob]:
-        for child in self.state_dirpath.iterdir():
-            if not child.name.startswith(filename_prefix):
-                continue
-
+        for child in self.state_dirpath.glob(f'{filename_prefix}*'):
             yield self.load_execute_job(child.resolve())
 
     def save_artifact_job(self, filename_prefix: str, job: ArtifactJob) -> None:
@@ -1,5 +1,5 @@
 import datetime
-import io
+import itertools
 import logging
 import multiprocessing
 import os
@@ -7,9 +7,11 @@ import re
 import sys
 import tarfile
 import time
-import urllib
-from collections.abc import Generator
-from functools import partial
+import urllib.request
+from collections import defaultdict
+from collections.abc import Iterator
+from functools import lru_cache, partial
+from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from typing import Any, Optional
 
@@ -17,6 +19,7 @@ import click
 import jira
 
 from . import (
+    URL_SCHEME_PATTERN,
     Arch,
     ArtifactJob,
     CLIContext,
@@ -29,6 +32,7 @@ from . import (
     ExecuteJob,
     Execution,
     Issue,
+    IssueAction,
     IssueConfig,
     IssueHandler,
     JiraJob,
@@ -43,16 +47,30 @@ from . import (
     Settings,
     TFRequest,
     eval_test,
+    get_jira_browse_url,
     get_url_basename,
+    parse_transition,
     render_template,
     yaml_parser,
     )
 
 JIRA_NONE_ID = '_NO_ISSUE'
+# fetch only the issue summary when that is all we need from Jira
+JIRA_SUMMARY_FIELDS = 'summary'
 STATEDIR_PARENT_DIR = Path('/var/tmp/newa')
-STATEDIR_NAME_PATTERN = r'^run-([0-9]+)$'
+STATEDIR_NAME_PATTERN = re.compile(r'^run-([0-9]+)$')
+# format of KEY=VALUE items accepted by --map-issue, --fixture and release mappings
+KEY_VALUE_PATTERN = re.compile(r'([^\s=]+)=([^=]*)')
+# format of key='some value' items accepted by --environment and --context
+CLI_OPTION_PATTERN = re.compile(r"""^\s*([a-zA-Z0-9_][a-zA-Z0-9_\-]*)=["']?(.*?)["']?\s*$""")
 TF_RESULT_PASSED = 'passed'
-ARGS_WITH_NO_STATEDIR = ['list', '--help']
+# Testing Farm request states after which the request won't change anymore
+TF_FINISHED_STATES = frozenset(('complete', 'error', 'canceled'))
+# delay in seconds before the first re-check of a TF request state
+TF_RECHECK_INITIAL_DELAY = 10
+ARGS_WITH_NO_STATEDIR = frozenset(('list', '--help'))
+# number of TF requests cancelled concurrently
+CANCEL_THREADS = 16
 
 logging.basicConfig(
     format='%(asctime)s %(message)s',
@@ -86,7 +104,7 @@ def get_state_dir(use_ppid: bool = False) -> Path:
                 last_dir = statedir
         # otherwise find the lowest unsused value for counter
         else:
-            r = re.match(STATEDIR_NAME_PATTERN, statedir.name)
+            r = STATEDIR_NAME_PATTERN.match(statedir.name)
             if r:
                 c = int(r.group(1))
                 counter = max(c, counter)
@@ -111,19 +129,51 @@ def initialize_jira_connection(ctx: CLIContext) -> Any:
 def issue_transition(connection: Any, transition: str, issue_id: str) -> None:
     try:
         # if the transition has a format status.resolution close with resolution
-        if '.' in transition:
-            status, resolution = transition.split('.', 1)
+        status, resolution = parse_transition(transition)
+        if resolution is not None:
             connection.transition_issue(issue_id,
                                         transition=status,
                                         resolution={'name': resolution})
         # otherwise close just using the status
         else:
             connection.transition_issue(issue_id,
-                                        transition=transition)
+                                        transition=status)
     except jira.JIRAError as e:
         raise Exception(f"Cannot transition issue {issue_id} into {transition}!") from e
 
 
+@lru_cache(maxsize=1)
+def get_comment_footer() -> str:
+    """ Return the footer appended to Jira comments, defined by NEWA_COMMENT_FOOTER envvar """
+    return os.environ.get('NEWA_COMMENT_FOOTER', '').strip()
+
+
+def get_issue_summaries(ctx: CLIContext,
+                        connection: Any,
+                        issue_ids: list[str]) -> dict[str, str]:
+    """ Return summaries of given Jira issues, fetched using a single query """
+    if not issue_ids:
+        return {}
+    try:
+        issues = connection.search_issues(f'key in ({",".join(issue_ids)})',
+                                          fields=JIRA_SUMMARY_FIELDS,
+                                          maxResults=len(issue_ids))
+    except jira.JIRAError as e:
+        # the query fails as a whole when any of the issues is not accessible,
+        # let callers fetch summaries individually instead
+        ctx.logger.warning(f'Unable to fetch summaries of issues {issue_ids}: {e.text}')
+        return {}
+    return {issue.key: issue.fields.summary for issue in issues}
+
+
+def yaml_members(tf: tarfile.TarFile) -> Iterator[tarfile.TarInfo]:
+    """ Yield YAML files from the archive, stripped of their directory """
+    for item in tf:
+        if item.name.endswith('.yaml'):
+            item.name = os.path.basename(item.name)
+            yield item
+
+
 @click.group(chain=True)
 @click.option(
     '--state-dir',
@@ -197,31 +247,26 @@ def main(click_context: click.Context,
 
     # this is here just to suppress state-dir creation
     # for certain cmdline arguments
-    if (not extract_state_dir) and set(ARGS_WITH_NO_STATEDIR) & set(sys.argv):
+    if (not extract_state_dir) and any(arg in ARGS_WITH_NO_STATEDIR for arg in sys.argv):
         return
 
     ctx.logger.info(f'Using --state-dir={ctx.state_dirpath}')
     if not ctx.state_dirpath.exists():
         ctx.new_state_dir = True
-        ctx.logger.debug(f'State directory {ctx.state_dirpath} does not exist, creating...')
+        ctx.logger.debug('State directory %s does not exist, creating...', ctx.state_dirpath)
         ctx.state_dirpath.mkdir(parents=True)
 
     # extract YAML files from the given archive to state-dir
     if extract_state_dir:
         ctx.new_state_dir = False
-        tar_open_kwargs: dict[str, Any] = {
-            'mode': 'r:*',
-            }
-        if re.match('^https?://', extract_state_dir):
-            data = urllib.request.urlopen(extract_state_dir).read()
-            tar_open_kwargs['fileobj'] = io.BytesIO(data)
+        if URL_SCHEME_PATTERN.match(extract_state_dir):
+            # read the archive as a stream while it is being downloaded
+            with urllib.request.urlopen(extract_state_dir) as response, \
+                    tarfile.open(fileobj=response, mode='r|*') as tf:
+                tf.extractall(path=ctx.state_dirpath, members=yaml_members(tf), filter='data')
         else:
-            tar_open_kwargs['name'] = Path(extract_state_dir)
-        with tarfile.open(**tar_open_kwargs) as tf:
-            for item in tf.getmembers():
-                if item.name.endswith('.yaml'):
-                    item.name = os.path.basename(item.name)
-                    tf.extract(item, path=ctx.state_dirpath, filter='data')
+            with tarfile.open(Path(extract_state_dir), mode='r:*') as tf:
+                tf.extractall(path=ctx.state_dirpath, members=yaml_members(tf), filter='data')
 
     # create empty ppid file
     with open(os.path.join(ctx.state_dirpath, f'{os.getppid()}.ppid'), 'w'):
@@ -229,7 +274,7 @@ def main(click_context: click.Context,
 
     def _split(s: str) -> tuple[str, str]:
         """ split key='some value' into a tuple (key, value) """
-        r = re.match(r"""^\s*([a-zA-Z0-9_][a-zA-Z0-9_\-]*)=["']?(.*?)["']?\s*$""", s)
+        r = CLI_OPTION_PATTERN.match(s)
         if not r:
             raise Exception(
                 f'Option value {s} has invalid format, key=value format expected!')
@@ -248,8 +293,20 @@ def main(click_context: click.Context,
     help='Print details of recent newa executions.',
     show_default=True,
     )
+@click.option(
+    '--events',
+    is_flag=True,
+    default=False,
+    help='Print only events, do not descend to Jira issues and requests.',
+    )
+@click.option(
+    '--issues',
+    is_flag=True,
+    default=False,
+    help='Print only events and Jira issues, do not descend to requests.',
+    )
 @click.pass_obj
-def cmd_list(ctx: CLIContext, last: int) -> None:
+def cmd_list(ctx: CLIContext, last: int, events: bool, issues: bool) -> None:
     ctx.enter_command('list')
     # when not in DEBUG, decrese log verbosity so it won't be too noisy
     # when loading individual YAML files
@@ -273,29 +330,35 @@ def cmd_list(ctx: CLIContext, last: int) -> None:
     for state_dir in state_dirs:
         print(f'{state_dir}:')
         ctx.state_dirpath = state_dir
-        event_jobs = list(ctx.load_artifact_jobs('event-'))
-        for event_job in event_jobs:
+        # stream jobs, there is no need to keep them all in memory
+        for event_job in ctx.load_artifact_jobs('event-'):
             if event_job.erratum:
                 _print(2, f'event {event_job.id} - {event_job.erratum.summary}')
                 _print(2, event_job.erratum.url)
             else:
                 _print(2, f'event {event_job.id}')
+            # do not even load Jira jobs when they won't be printed
+            if events:
+                continue
             jira_file_prefix = f'jira-{event_job.event.id}-{event_job.short_id}'
-            jira_jobs = list(ctx.load_jira_jobs(jira_file_prefix))
-            for jira_job in jira_jobs:
+            for jira_job in ctx.load_jira_jobs(jira_file_prefix):
                 jira_summary = f'- {jira_job.jira.summary}' if jira_job.jira.summary else ''
                 _print(4, f'issue {jira_job.jira.id} {jira_summary}')
                 if jira_job.jira.url:
                     _print(4, jira_job.jira.url)
+                # do not load schedule and execute jobs when they won't be printed
+                if issues:
+                    continue
                 schedule_file_prefix = (f'schedule-{event_job.event.id}-'
                                         f'{event_job.short_id}-{jira_job.jira.id}')
                 schedule_jobs = list(ctx.load_schedule_jobs(schedule_file_prefix))
                 # print RP launch URL, should be common for all execute jobs
-                if schedule_jobs and schedule_jobs[0].request.reportportal:
-                    launch_name = schedule_jobs[0].request.reportportal.get('launch_name', None)
+                rp_config = schedule_jobs[0].request.reportportal if schedule_jobs else None
+                if rp_config:
+                    launch_name = rp_config.get('launch_name', None)
                     if launch_name:
                         _print(6, f'ReportPortal launch: {launch_name}')
-                        launch_url = schedule_jobs[0].request.reportportal.get('launch_url', None)
+                        launch_url = rp_config.get('launch_url', None)
                         if launch_url:
                             _print(6, launch_url)
                 for schedule_job in schedule_jobs:
@@ -323,6 +386,16 @@ def cmd_list(ctx: CLIContext, last: int) -> None:
     sys.exit(0)
 
 
+@lru_cache(maxsize=128)
+def parse_release_mapping(mapping: str) -> tuple[str, str]:
+    """ Parse release mapping 'pattern=value' into a tuple (pattern, value) """
+    r = KEY_VALUE_PATTERN.fullmatch(mapping)
+    if not r:
+        raise Exception(f"Mapping {mapping} does not having expected format 'patten=value'")
+    pattern, value = r.groups()
+    return (pattern, value)
+
+
 def apply_release_mapping(string: str,
                           mapping: Optional[list[str]] = None,
                           regexp: bool = True,
@@ -335,24 +408,26 @@ def apply_release_mapping(string: str,
             r'RHEL-10\.0\.BETA=RHEL-10-Beta',
             r'$=-Nightly',
             ]
+    # for string matching return the first match
+    if not regexp:
+        for m in mapping:
+            pattern, value = parse_release_mapping(m)
+            if string == pattern:
+                if logger:
+                    logger.debug(
+                        'Found match in %s for mapping %s, new value %s', string, m, value)
+                return value
+        return string
+    # for regexp=True apply each matching regexp, re.subn() both finds
+    # and substitutes matches in a single pass over the string
     new_string = string
     for m in mapping:
-        r = re.fullmatch(r'([^\s=]+)=([^=]*)', m)
-        if not r:
-            raise Exception(f"Mapping {m} does not having expected format 'patten=value'")
-        pattern, value = r.groups()
-        # for regexp=True apply each matching regexp
-        if regexp and re.search(pattern, new_string):
-            new_string = re.sub(pattern, value, new_string)
-            if logger:
-                logger.debug(
-                    f'Found match in {new_string} for mapping {m}, new value {new_string}')
-        # for string matching return the first match
-        if (not regexp) and new_string == pattern:
-            if logger:
-                logger.debug(
-                    f'Found match in {new_string} for mapping {m}, new value {new_string}')
-            return value
+        pattern, value = parse_release_mapping(m)
+        old_string = new_string
+        new_string, matches = re.subn(pattern, value, old_string)
+        if matches and logger:
+            logger.debug(
+                'Found match in %s for mapping %s, new value %s', old_string, m, new_string)
     return new_string
 
 
@@ -406,18 +481,24 @@ def cmd_event(
         if not et_url:
             raise Exception('Errata Tool URL is not configured!')
 
+        # errata usually share a handful of releases, map each release only once
+        release_composes: dict[str, str] = {}
         for erratum_id in errata_ids:
             event = Event(type_=EventType.ERRATUM, id=erratum_id)
             errata = ErrataTool(url=et_url).get_errata(event)
             for erratum in errata:
                 release = erratum.release.strip()
+                if release in release_composes:
+                    compose = release_composes[release]
                 # when compose_mapping is provided, apply it with regexp disabled
-                if compose_mapping:
+                elif compose_mapping:
                     compose = apply_release_mapping(
                         release, compose_mapping, regexp=False, logger=ctx.logger)
+                    release_composes[release] = compose
                 # otherwise use the built-in default mapping
                 else:
                     compose = apply_release_mapping(release, logger=ctx.logger)
+                    release_composes[release] = compose
                 # skip compose if it has been transformed to an empty compose
                 if not compose:
                     ctx.logger.info(
@@ -447,6 +528,40 @@ def cmd_event(
         ctx.save_artifact_job('event-', artifact_job)
 
 
+def sort_issue_actions(actions: list[IssueAction]) -> list[IssueAction]:
+    """
+    Order issue actions so that each action follows its parent.
+
+    Otherwise the order from the issue config is kept. Actions whose parent is
+    not in the config are kept in place, actions in a parent cycle are moved to
+    the end, processing them then reports the missing parent.
+    """
+
+    known_ids = {action.id for action in actions}
+    # actions waiting for their parent (parent_id : actions)
+    waiting: defaultdict[str, list[IssueAction]] = defaultdict(list)
+    ordered_ids: set[str] = set()
+    ordered: list[IssueAction] = []
+
+    for action in actions:
+        parent_id = action.parent_id
+        if parent_id and parent_id in known_ids and parent_id not in ordered_ids:
+            waiting[parent_id].append(action)
+            continue
+        # add the action followed by all its (transitive) children waiting for it
+        stack = [action]
+        while stack:
+            current = stack.pop()
+            ordered.append(current)
+            if current.id:
+                ordered_ids.add(current.id)
+                stack.extend(reversed(waiting.pop(current.id, [])))
+
+    for waiting_actions in waiting.values():
+        ordered.extend(waiting_actions)
+    return ordered
+
+
 @main.command(name='jira')
 @click.option(
     '--issue-config',
@@ -499,6 +614,7 @@ def cmd_jira(
     jira_url = ctx.settings.jira_url
     if not jira_url:
         raise Exception('Jira URL is not configured!')
+    jira_browse_url = get_jira_browse_url(jira_url)
 
     jira_token = ctx.settings.jira_token
     if not jira_token:
@@ -514,16 +630,16 @@ def cmd_jira(
             raise Exception('Errata Tool URL is not configured!')
         et = ErrataTool(url=et_url)
 
-    def _jira_fake_id_generator() -> Generator[str, int, None]:
-        n = 1
-        while True:
-            yield f'{JIRA_NONE_ID}_{n}'
-            n += 1
-
-    jira_none_id = _jira_fake_id_generator()
+    # --issue is checked in Jira only once
+    issue_verified = False
+    # fake Jira ids _NO_ISSUE_1, _NO_ISSUE_2, ... used when no issue is given
+    jira_none_id = map(f'{JIRA_NONE_ID}_{{}}'.format, itertools.count(1))
 
     # load issue mapping specified on a command line
     issue_mapping: dict[str, str] = {}
+    # closed state of mapped issues, the same issues are mapped for all artifact jobs
+    # and cmd_jira never changes their state
+    mapped_issue_closed: dict[str, bool] = {}
     artifact_jobs = ctx.load_artifact_jobs('event-')
 
     # issue mapping is relevant only when using issue-config file
@@ -534,13 +650,19 @@ def cmd_jira(
 
         # read --map-issue keys and values into a dictionary
         for m in map_issue:
-            r = re.fullmatch(r'([^\s=]+)=([^=]*)', m)
+            r = KEY_VALUE_PATTERN.fullmatch(m)
             if not r:
                 raise Exception(f"Mapping {m} does not having expected format 'key=value'")
             key, value = r.groups()
             issue_mapping[key] = value
+        # order issue actions so that parents are processed before their children
+        issue_actions = sort_issue_actions(config.issues)
+        # transitions set on issues of actions with auto_transition enabled
+        transitions = config.transitions
+        auto_transition_passed = transitions.passed[0] if transitions.passed else None
+        auto_transition_processed = transitions.processed[0] if transitions.processed else None
         # gather ids from the config file
-        ids = [getattr(action, "id", None) for action in config.issues[:]]
+        ids = {getattr(action, "id", None) for action in config.issues}
         # check for keys not present in a config file
         for key in issue_mapping:
             if key not in ids:
@@ -564,23 +686,21 @@ def cmd_jira(
                     None))
             ctx.logger.info("Initialized Jira handler")
 
-            # All issue action from the configuration.
-            issue_actions = config.issues[:]
+            # variables for rendering issue action templates, same for all actions
+            jinja_vars: dict[str, Any] = {
+                'ERRATUM': artifact_job.erratum,
+                'COMPOSE': artifact_job.compose,
+                'ENVIRONMENT': ctx.cli_environment,
+                }
 
             # Processed action (action.id : issue).
             processed_actions: dict[str, Issue] = {}
 
             # action_ids for which new Issues have been created
-            created_action_ids: list[str] = []
-
-            # Length of the queue the last time issue action was processed,
-            # Use to prevent endless loop over the issue actions.
-            endless_loop_check: dict[str, int] = {}
+            created_action_ids: set[str] = set()
 
-            # Iterate over issue actions. Take one, if it's not possible to finish it,
-            # put it back at the end of the queue.
-            while issue_actions:
-                action = issue_actions.pop(0)
+            # Iterate over issue actions, parents always come before their children.
+            for action in issue_actions:
 
                 if not action.id:
                     raise Exception(f"Action {action} does not have 'id' assigned")
@@ -601,62 +721,25 @@ def cmd_jira(
                 if not action.description:
                     raise Exception(f"Action {action} does not have a 'description' defined.")
 
-                rendered_summary = render_template(
-                    action.summary,
-                    ERRATUM=artifact_job.erratum,
-                    COMPOSE=artifact_job.compose,
-                    ENVIRONMENT=ctx.cli_environment)
-                rendered_description = render_template(
-                    action.description,
-                    ERRATUM=artifact_job.erratum,
-                    COMPOSE=artifact_job.compose,
-                    ENVIRONMENT=ctx.cli_environment)
-                if assignee:
-                    rendered_assignee = assignee
-                elif unassigned:
-                    rendered_assignee = None
-                elif action.assignee:
-                    rendered_assignee = render_template(
-                        action.assignee,
-                        ERRATUM=artifact_job.erratum,
-                        COMPOSE=artifact_job.compose,
-                        ENVIRONMENT=ctx.cli_environment)
-                else:
-                    rendered_assignee = None
-                if action.newa_id:
-                    action.newa_id = render_template(
-                        action.newa_id,
-                        ERRATUM=artifact_job.erratum,
-                        COMPOSE=artifact_job.compose,
-                        ENVIRONMENT=ctx.cli_environment)
-
-                # Detect that action has parent available (if applicable), if we went trough the
-                # actions already and parent was not found, we abort.
+                # Detect that action has parent available (if applicable), parents are
+                # processed first so if the parent was not found by now, we abort.
                 if action.parent_id and action.parent_id not in processed_actions:
-                    queue_length = len(issue_actions)
-                    last_queue_length = endless_loop_check.get(action.id, 0)
-                    if last_queue_length == queue_length:
-                        raise Exception(f"Parent {action.parent_id} for {action.id} not found!"
-                                        "It does not exists or is closed.")
-
-                    endless_loop_check[action.id] = queue_length
-                    ctx.logger.info(f"Skipped for now (parent {action.parent_id} not yet found)")
+                    raise Exception(f"Parent {action.parent_id} for {action.id} not found!"
+                                    "It does not exists or is closed.")
 
-                    issue_actions.append(action)
-                    continue
+                # render templates only once the action is really going to be processed
+                rendered_summary = render_template(action.summary, **jinja_vars)
+                if action.newa_id:
+                    action.newa_id = render_template(action.newa_id, **jinja_vars)
 
                 # Issues related to the curent respin and previous one(s).
                 new_issues: list[Issue] = []
                 old_issues: list[Issue] = []
 
                 # read transition settings
-                transition_passed = None
-                transition_processed = None
-                if action.auto_transition:
-                    if jira_handler.transitions.passed:
-                        transition_passed = jira_handler.transitions.passed[0]
-                    if jira_handler.transitions.processed:
-                        transition_processed = jira_handler.transitions.processed[0]
+                transition_passed = auto_transition_passed if action.auto_transition else None
+                transition_processed = (
+                    auto_transition_processed if action.auto_transition else None)
 
                 # first check if we have a match in issue_mapping
                 if action.id and action.id in issue_mapping and issue_mapping[action.id].strip():
@@ -665,9 +748,11 @@ def cmd_jira(
                         group=config.group,
                         transition_passed=transition_passed,
                         transition_processed=transition_processed)
-                    jira_issue = jira_handler.get_details(mapped_issue)
-                    mapped_issue.closed = jira_issue.get_field(
-                        "status").name in jira_handler.transitions.closed
+                    if mapped_issue.id not in mapped_issue_closed:
+                        jira_issue = jira_handler.get_details(mapped_issue, fields='status')
+                        mapped_issue_closed[mapped_issue.id] = jira_issue.get_field(
+                            "status").name in jira_handler.transitions.closed
+                    mapped_issue.closed = mapped_issue_closed[mapped_issue.id]
                     new_issues.append(mapped_issue)
 
                 # otherwise we need to search for the issue in Jira
@@ -681,21 +766,23 @@ def cmd_jira(
                         search_result = jira_handler.get_related_issues(
                             action, all_respins=True, closed=True)
 
+                    # In general, issue is new (relevant to the current respin) if it has
+                    # newa_id of this action in the description. Otherwise, it is old
+                    # (relevant to the previous respins).
+                    # However, it might happen that we encounter an issue that is new but
+                    # its original parent has been replaced by a newly created issue.
+                    # In such a case we have to re-create the issue as well and drop the
+                    # old one.
+                    # Both conditions depend only on the action, evaluate them once.
+                    action_newa_id = jira_handler.newa_id(action)
+                    parent_recreated = bool(action.parent_id) and \
+                        action.parent_id in created_action_ids
+
                     for jira_issue_key, jira_issue in search_result.items():
                         ctx.logger.info(f"Checking {jira_issue_key}")
 
-                        # In general, issue is new (relevant to the current respin) if it has
-                        # newa_id of this action in the description. Otherwise, it is old
-                        # (relevant to the previous respins).
-                        # However, it might happen that we encounter an issue that is new but
-                        # its original parent has been replaced by a newly created issue.
-                        # In such a case we have to re-create the issue as well and drop the
-                        # old one.
-                        is_new = False
-                        if jira_handler.newa_id(action) in jira_issue["description"] \
-                            and (not action.parent_id
-                                 or action.parent_id not in created_action_ids):
-                            is_new = True
+                        is_new = (not parent_recreated
+                                  and action_newa_id in jira_issue["description"])
 
                         if is_new:
                             new_issues.append(
@@ -743,6 +830,17 @@ def cmd_jira(
                     if action.parent_id:
                         parent = processed_actions.get(action.parent_id, None)
 
+                    # description and assignee are needed only for a new issue
+                    rendered_description = render_template(action.description, **jinja_vars)
+                    if assignee:
+                        rendered_assignee = assignee
+                    elif unassigned:
+                        rendered_assignee = None
+                    elif action.assignee:
+                        rendered_assignee = render_template(action.assignee, **jinja_vars)
+                    else:
+                        rendered_assignee = None
+
                     new_issue = jira_handler.create_issue(
                         action,
                         rendered_summary,
@@ -755,7 +853,7 @@ def cmd_jira(
                         fields=action.fields)
 
                     processed_actions[action.id] = new_issue
-                    created_action_ids.append(action.id)
+                    created_action_ids.add(action.id)
 
                     new_issues.append(new_issue)
                     ctx.logger.info(f"New issue {new_issue.id} created")
@@ -780,24 +878,18 @@ def cmd_jira(
                         action.erratum_comment_triggers and
                         ErratumCommentTrigger.JIRA in action.erratum_comment_triggers and
                         artifact_job.erratum):
-                    issue_url = urllib.parse.urljoin(
-                        ctx.settings.jira_url, f"/browse/{new_issue.id}")
                     et.add_comment(
                         artifact_job.erratum.id,
                         'New Errata Workflow Automation (NEWA) prepared '
                         'a Jira tracker for this advisory.\n'
                         f'{new_issue.id} - {rendered_summary}\n'
-                        f'{issue_url}')
+                        f'{jira_browse_url}{new_issue.id}')
                     ctx.logger.info(
                         f"Erratum {artifact_job.erratum.id} was updated "
                         f"with a comment about {new_issue.id}")
 
                 if action.job_recipe:
-                    recipe_url = render_template(
-                        action.job_recipe,
-                        ERRATUM=artifact_job.erratum,
-                        COMPOSE=artifact_job.compose,
-                        ENVIRONMENT=ctx.cli_environment)
+                    recipe_url = render_template(action.job_recipe, **jinja_vars)
                     if action.erratum_comment_triggers:
                         new_issue.erratum_comment_triggers = action.erratum_comment_triggers
                     jira_job = JiraJob(event=artifact_job.event,
@@ -823,9 +915,11 @@ def cmd_jira(
             if not job_recipe:
                 raise Exception("Option --job-recipe is mandatory when --issue-config is not set")
             if issue:
-                # verify that specified Jira issue truly exists
-                jira_connection = initialize_jira_connection(ctx)
-                jira_connection.issue(issue)
+                # verify that specified Jira issue truly exists, once for all artifact jobs
+                if not issue_verified:
+                    jira_connection = initialize_jira_connection(ctx)
+                    jira_connection.issue(issue, fields=JIRA_SUMMARY_FIELDS)
+                    issue_verified = True
                 ctx.logger.info(f"Using issue {issue}")
                 new_issue = Issue(issue)
             else:
@@ -860,6 +954,8 @@ def cmd_jira(
 @click.pass_obj
 def cmd_schedule(ctx: CLIContext, arch: list[str], fixtures: list[str]) -> None:
     ctx.enter_command('schedule')
+    # fixture values are parsed as YAML, share the parser across all jobs
+    fixture_parser = yaml_parser()
 
     for jira_job in ctx.load_jira_jobs('jira-'):
         # prepare parameters based on the recipe from recipe.url
@@ -877,10 +973,10 @@ def cmd_schedule(ctx: CLIContext, arch: list[str], fixtures: list[str]) -> None:
         initial_config = RawRecipeConfigDimension(compose=compose,
                                                   environment=ctx.cli_environment,
                                                   context=ctx.cli_context)
-        ctx.logger.debug(f'Initial config: {initial_config})')
+        ctx.logger.debug('Initial config: %s)', initial_config)
         if fixtures:
             for fixture in fixtures:
-                r = re.fullmatch(r'([^\s=]+)=([^=]*)', fixture)
+                r = KEY_VALUE_PATTERN.fullmatch(fixture)
                 if not r:
                     raise Exception(
                         f"Fixture {fixture} does not having expected format 'name=value'")
@@ -894,15 +990,15 @@ def cmd_schedule(ctx: CLIContext, arch: list[str], fixtures: list[str]) -> None:
                 # now we are at the lowest level
                 # Is it beneficial to parse the input as yaml?
                 # It enables us to define list and dicts but there might be drawbacks as well
-                value = yaml_parser().load(fixture_value)
+                value = fixture_parser.load(fixture_value)
                 fixture_config[fixture_name] = value  # type: ignore[literal-required]
-            ctx.logger.debug(f'Initial config modified through --fixture: {initial_config})')
+            ctx.logger.debug('Initial config modified through --fixture: %s)', initial_config)
 
         # when testing erratum, add special context erratum=XXXX
         if jira_job.erratum:
             initial_config['context'].update({'erratum': str(jira_job.erratum.id)})
 
-        if re.search('^https?://', jira_job.recipe.url):
+        if URL_SCHEME_PATTERN.match(jira_job.recipe.url):
             config = RecipeConfig.from_yaml_url(jira_job.recipe.url)
         else:
             config = RecipeConfig.from_yaml_file(Path(jira_job.recipe.url))
@@ -943,24 +1039,21 @@ def cmd_schedule(ctx: CLIContext, arch: list[str], fixtures: list[str]) -> None:
                     "tmt",
                     "testingfarm",
                     "environment",
-                    "context",
-                    "compose"):
-                # compose value is a string, not dict
-                if attr == 'compose':
-                    value = getattr(request, attr, '')
-                    new_value = render_template(str(value), **jinja_vars)
-                    if new_value:
-                        setattr(request, attr, new_value)
-                else:
-                    # getattr(request, attr) could also be None due to 'attr' being None
-                    mapping = getattr(request, attr, {}) or {}
-                    for (key, value) in mapping.items():
-                        # launch_attributes is a dict
-                        if key == 'launch_attributes':
-                            for (k, v) in value.items():
-                                mapping[key][k] = render_template(str(v), **jinja_vars)
-                        else:
-                            mapping[key] = render_template(str(value), **jinja_vars)
+                    "context"):
+                # getattr(request, attr) could also be None due to 'attr' being None
+                mapping = getattr(request, attr, {}) or {}
+                for (key, value) in mapping.items():
+                    # launch_attributes is a dict
+                    if key == 'launch_attributes':
+                        for (k, v) in value.items():
+                            mapping[key][k] = render_template(str(v), **jinja_vars)
+                    else:
+                        mapping[key] = render_template(str(value), **jinja_vars)
+            # compose value is a string, not dict, render it last as before
+            # so that it can use already rendered CONTEXT and ENVIRONMENT values
+            new_compose = render_template(str(request.compose), **jinja_vars)
+            if new_compose:
+                request.compose = new_compose
 
             # export schedule_job yaml
             schedule_job = ScheduleJob(
@@ -984,21 +1077,44 @@ def cmd_cancel(ctx: CLIContext) -> None:
         raise ValueError("TESTING_FARM_API_TOKEN not set!")
     os.environ["TESTING_FARM_API_TOKEN"] = tf_token
 
-    for execute_job in ctx.load_execute_jobs('execute-'):
-        # if not execute_job.execution.result:
-        tf_request = TFRequest(
-            api=execute_job.execution.request_api,
-            uuid=execute_job.execution.request_uuid)
+    execute_jobs = list(ctx.load_execute_jobs('execute-'))
+    if not execute_jobs:
+        return
+    # TF requests are independent, cancel them concurrently
+    # and store each updated job from the main thread once it is done
+    failed_requests = []
+    with ThreadPool(min(len(execute_jobs), CANCEL_THREADS)) as thread_pool:
+        for execute_job, cancelled in thread_pool.imap_unordered(
+                partial(cancel_execute_job, ctx), execute_jobs):
+            if cancelled:
+                ctx.save_execute_job('execute-', execute_job)
+            else:
+                failed_requests.append(execute_job.execution.request_uuid)
+    if failed_requests:
+        raise Exception(f"Failed to cancel TF requests {', '.join(map(str, failed_requests))}!")
+
+
+def cancel_execute_job(ctx: CLIContext, execute_job: ExecuteJob) -> tuple[ExecuteJob, bool]:
+    """ Cancel TF request of a job, return the job and whether it was processed without errors """
+    tf_request = TFRequest(
+        api=execute_job.execution.request_api,
+        uuid=execute_job.execution.request_uuid)
+    # errors are only logged so that a single failing request
+    # does not prevent other requests from being cancelled and stored
+    try:
         tf_request.cancel(ctx)
         tf_request.fetch_details()
-        if tf_request.details:
-            execute_job.execution.state = tf_request.details['state']
-            if 'cancel' in execute_job.execution.state:
-                execute_job.execution.state = 'canceled'
-                execute_job.execution.result = 'error'
-            if tf_request.details['result']:
-                execute_job.execution.result = tf_request.details['result']['overall']
-            ctx.save_execute_job('execute-', execute_job)
+    except Exception as e:
+        ctx.logger.error(f'Failed to cancel TF request {tf_request.uuid}: {e}')
+        return (execute_job, False)
+    if tf_request.details:
+        execute_job.execution.state = tf_request.details['state']
+        if 'cancel' in execute_job.execution.state:
+            execute_job.execution.state = 'canceled'
+            execute_job.execution.result = 'error'
+        if tf_request.details['result']:
+            execute_job.execution.result = tf_request.details['result']['overall']
+    return (execute_job, True)
 
 
 @main.command(name='execute')
@@ -1087,51 +1203,46 @@ def cmd_execute(
     # before actual scheduling prepare RP launches and store their ids
     # we will create one launch per Jira issue so we need to sort out
     # schedule_jobs per Jira id
-    jira_schedule_job_mapping = {}
+    jira_schedule_job_mapping: defaultdict[str, list[ScheduleJob]] = defaultdict(list)
     # load all jobs at first as we would be rewriting them later
     for schedule_job in ctx.load_schedule_jobs('schedule-'):
-        jira_id = schedule_job.jira.id
-        if jira_id not in jira_schedule_job_mapping:
-            jira_schedule_job_mapping[jira_id] = [schedule_job]
-        else:
-            jira_schedule_job_mapping[jira_id].append(schedule_job)
+        jira_schedule_job_mapping[schedule_job.jira.id].append(schedule_job)
     # store all launch uuids for later finishing
     launch_list = []
     # now we process jobs for each jira_id
-    jira_url = ctx.settings.jira_url
+    jira_browse_url = get_jira_browse_url(ctx.settings.jira_url)
+    # Jira connection is created on first use and shared by all issues
+    jira_connection = None
     for jira_id, schedule_jobs in jira_schedule_job_mapping.items():
         # when --continue the launch was probably already created
         # check the 1st job for launch_uuid
         job = schedule_jobs[0]
-        launch_uuid = job.request.reportportal.get('launch_uuid', None)
+        rp_config = job.request.reportportal
+        launch_uuid = rp_config.get('launch_uuid', None)
         if launch_uuid:
             ctx.logger.debug(
-                f'Skipping RP launch creation for {jira_id} as {launch_uuid} already exists.')
+                'Skipping RP launch creation for %s as %s already exists.', jira_id, launch_uuid)
             launch_list.append(launch_uuid)
             continue
         # otherwise we proceed with launch creation
         # get launch details from the first schedule job
-        launch_name = schedule_jobs[0].request.reportportal['launch_name']
-        launch_attrs = schedule_jobs[0].request.reportportal.get(
-            'launch_attributes', {})
+        launch_name = rp_config['launch_name']
+        launch_attrs = rp_config.get('launch_attributes', {})
         launch_attrs.update({'newa_statedir': str(ctx.state_dirpath)})
         # we store CLI --context definitions as well but not overriding
         # existing launch_attributes
         for (k, v) in ctx.cli_context.items():
             if k in launch_attrs:
-                ctx.logger.debug(f'Not storing context {k} as launch attribute due to a collision')
+                ctx.logger.debug(
+                    'Not storing context %s as launch attribute due to a collision', k)
             else:
                 launch_attrs[k] = v
-        launch_description = schedule_jobs[0].request.reportportal.get(
-            'launch_description', '')
+        launch_description = rp_config.get('launch_description', '')
         if launch_description:
             launch_description += '<br><br>'
         # add the number of jobs
         if not jira_id.startswith(JIRA_NONE_ID):
-            issue_url = urllib.parse.urljoin(
-                jira_url,
-                f"/browse/{jira_id}")
-            launch_description += f'[{jira_id}]({issue_url}): '
+            launch_description += f'[{jira_id}]({jira_browse_url}{jira_id}): '
         launch_description += (f'{len(schedule_jobs)} '
                                'request(s) in total')
         # create the actual launch
@@ -1151,11 +1262,12 @@ def cmd_execute(
 
         # update Jira issue with a note about the RP launch
         if not jira_id.startswith(JIRA_NONE_ID):
-            jira_connection = initialize_jira_connection(ctx)
+            if jira_connection is None:
+                jira_connection = initialize_jira_connection(ctx)
             comment = ("NEWA has scheduled automated test recipe for this issue, test "
                        f"results will be uploaded to ReportPortal launch\n{launch_url}")
             # check if we have a comment footer defined in envvar
-            footer = os.environ.get('NEWA_COMMENT_FOOTER', '').strip()
+            footer = get_comment_footer()
             if footer:
                 comment += f'\n{footer}'
             try:
@@ -1175,14 +1287,14 @@ def cmd_execute(
             if (ctx.settings.et_enable_comments and
                     ErratumCommentTrigger.EXECUTE in job.jira.erratum_comment_triggers and
                     job.erratum):
-                issue_summary = jira_connection.issue(jira_id).fields.summary
-                issue_url = urllib.parse.urljoin(ctx.settings.jira_url, f"/browse/{jira_id}")
+                issue_summary = jira_connection.issue(
+                    jira_id, fields=JIRA_SUMMARY_FIELDS).fields.summary
                 et.add_comment(
                     job.erratum.id,
                     'The New Errata Workflow Automation (NEWA) has initiated test execution '
                     'for this advisory.\n'
                     f'{jira_id} - {issue_summary}\n'
-                    f'{issue_url}\n'
+                    f'{jira_browse_url}{jira_id}\n'
                     f'{launch_url}')
                 ctx.logger.info(
                     f"Erratum {job.erratum.id} was updated with a comment about {jira_id}")
@@ -1190,13 +1302,13 @@ def cmd_execute(
     # get a list of files to be scheduled so that they can be distributed across workers
     schedule_list = [
         (ctx, ctx.state_dirpath / child.name)
-        for child in ctx.state_dirpath.iterdir()
-        if child.name.startswith('schedule-')]
+        for child in ctx.state_dirpath.glob('schedule-*')]
 
-    worker_pool = multiprocessing.Pool(workers if workers > 0 else len(schedule_list))
-    for _ in worker_pool.starmap(worker, schedule_list):
-        # small sleep to avoid race conditions inside tmt code
-        time.sleep(0.1)
+    # workers spend most of their time polling TF, hand the jobs over one by one
+    # so that a free worker picks up the next job immediately; starmap() waits
+    # for all jobs to finish before re-raising a failure of any of them
+    with multiprocessing.Pool(workers if workers > 0 else len(schedule_list)) as worker_pool:
+        worker_pool.starmap(worker, schedule_list, chunksize=1)
 
     ctx.logger.info('Finished execution')
 
@@ -1284,12 +1396,15 @@ def worker(ctx: CLIContext, schedule_file: Path) -> None:
         log(f'Not waiting for TF request {tf_request.uuid} to finish (--no-wait set).')
         return
 
-    # wait for TF job to finish
+    # wait for TF job to finish, re-checking quickly at first and backing off
+    # exponentially up to the configured delay
     finished = False
-    delay = int(ctx.settings.tf_recheck_delay)
+    max_delay = int(ctx.settings.tf_recheck_delay)
+    delay = min(TF_RECHECK_INITIAL_DELAY, max_delay)
     while not finished:
         if not skip_initial_sleep:
             time.sleep(delay)
+            delay = min(delay * 2, max_delay)
         skip_initial_sleep = False
         tf_request.fetch_details()
         if tf_request.details:
@@ -1297,7 +1412,7 @@ def worker(ctx: CLIContext, schedule_file: Path) -> None:
             envs = ','.join([f"{e['os']['compose']}/{e['arch']}"
                              for e in tf_request.details['environments_requested']])
             log(f'TF request {tf_request.uuid} envs: {envs} state: {state}')
-            finished = state in ['complete', 'error', 'canceled']
+            finished = state in TF_FINISHED_STATES
         else:
             log(f'Could not read details of TF request {tf_request.uuid}')
 
@@ -1327,6 +1442,7 @@ def cmd_report(ctx: CLIContext) -> None:
                       project=rp_project)
     # initialize Jira connection
     jira_connection = initialize_jira_connection(ctx)
+    jira_browse_url = get_jira_browse_url(ctx.settings.jira_url)
     # initialize ET connection
     if ctx.settings.et_enable_comments:
         et_url = ctx.settings.et_url
@@ -1336,23 +1452,30 @@ def cmd_report(ctx: CLIContext) -> None:
 
     # process each stored execute file
     # before actual reporting split jobs per jira id
-    jira_execute_job_mapping = {}
+    jira_execute_job_mapping: defaultdict[str, list[ExecuteJob]] = defaultdict(list)
     # load all jobs at first as we would be rewriting them later
     for execute_job in ctx.load_execute_jobs('execute-'):
-        jira_id = execute_job.jira.id
-        if jira_id not in jira_execute_job_mapping:
-            jira_execute_job_mapping[jira_id] = [execute_job]
-        else:
-            jira_execute_job_mapping[jira_id].append(execute_job)
+        jira_execute_job_mapping[execute_job.jira.id].append(execute_job)
+
+    # fetch summaries of all issues we will comment about in Errata Tool at once
+    issue_summaries: dict[str, str] = {}
+    if ctx.settings.et_enable_comments:
+        issue_summaries = get_issue_summaries(
+            ctx,
+            jira_connection,
+            [jira_id for jira_id, execute_jobs in jira_execute_job_mapping.items()
+             if not jira_id.startswith(JIRA_NONE_ID) and
+             execute_jobs[0].request.reportportal.get('launch_uuid', None) and
+             ErratumCommentTrigger.REPORT in execute_jobs[0].jira.erratum_comment_triggers and
+             execute_jobs[0].erratum])
 
     # now for each jira id finish the respective launch and report results
     for jira_id, execute_jobs in jira_execute_job_mapping.items():
         all_tests_passed = True
         # get RP launch details
-        launch_uuid = execute_jobs[0].request.reportportal.get(
-            'launch_uuid', None)
-        launch_url = execute_jobs[0].request.reportportal.get(
-            'launch_url', None)
+        rp_config = execute_jobs[0].request.reportportal
+        launch_uuid = rp_config.get('launch_uuid', None)
+        launch_url = rp_config.get('launch_url', None)
         if launch_uuid:
             # prepare description with individual results
             results: dict[str, dict[str, str]] = {}
@@ -1365,19 +1488,24 @@ def cmd_report(ctx: CLIContext) -> None:
                     'url': job.execution.artifacts_url}
                 if job.execution.result != TF_RESULT_PASSED:
                     all_tests_passed = False
-            launch_description = execute_jobs[0].request.reportportal.get(
-                'launch_description', '')
+            launch_description = rp_config.get('launch_description', '')
             if launch_description:
                 launch_description += '<br><br>'
             if not jira_id.startswith(JIRA_NONE_ID):
                 launch_description += f'{jira_id}: '
             launch_description += f'{len(execute_jobs)} request(s) in total:'
-            jira_description = launch_description.replace('<br>', '\n')
-            for req in sorted(results.keys(), key=lambda x: int(x.split('.')[-1])):
+            # collect description lines and join them at once, the descriptions
+            # may get long when there are many requests
+            launch_lines = [launch_description]
+            jira_lines = [launch_description.replace('<br>', '\n')]
+            for req in sorted(results, key=lambda x: int(x.rsplit('.', 1)[-1])):
+                res = results[req]
                 # it would be nice to use hyperlinks in launch description however we
                 # would hit description length limit. Therefore using plain text
-                launch_description += "<br>{id}: {state}, {result}".format(**results[req])
-                jira_description += "\n[{id}|{url}]: {state}, {result}".format(**results[req])
+                launch_lines.append(f"{req}: {res['state']}, {res['result']}")
+                jira_lines.append(f"[{req}|{res['url']}]: {res['state']}, {res['result']}")
+            launch_description = '<br>'.join(launch_lines)
+            jira_description = '\n'.join(jira_lines)
             # finish launch just in case it hasn't been finished already
             # and update description with more detailed results
             rp.finish_launch(launch_uuid)
@@ -1389,7 +1517,7 @@ def cmd_report(ctx: CLIContext) -> None:
                     comment = (f"NEWA has imported test results to RP launch "
                                f"{launch_url}\n\n{jira_description}")
                     # check if we have a comment footer defined in envvar
-                    footer = os.environ['NEWA_COMMENT_FOOTER'].strip()
+                    footer = get_comment_footer()
                     if footer:
                         comment += f'\n{footer}'
                     jira_connection.add_comment(
@@ -1423,8 +1551,11 @@ def cmd_report(ctx: CLIContext) -> None:
                         ErratumCommentTrigger.REPORT in
                         execute_job.jira.erratum_comment_triggers and
                         execute_job.erratum):
-                    issue_summary = jira_connection.issue(jira_id).fields.summary
-                    issue_url = urllib.parse.urljoin(ctx.settings.jira_url, f"/browse/{jira_id}")
+                    issue_summary = issue_summaries.get(jira_id)
+                    if issue_summary is None:
+                        issue_summary = jira_connection.issue(
+                            jira_id, fields=JIRA_SUMMARY_FIELDS).fields.summary
+                    issue_url = f'{jira_browse_url}{jira_id}'
                     et.add_comment(
                         execute_job.erratum.id,
                         'The New Errata Workflow Automation (NEWA) has finished test execution '
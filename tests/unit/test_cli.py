@@ -104,3 +104,19 @@ def test_event_no_id(mock_clicontext):
     result = runner.invoke(cli.cmd_event, obj=ctx)
     assert result.exception
     assert len(list(Path(ctx.state_dirpath).glob('event-*'))) == 0
+
+
+@pytest.mark.usefixtures('_mock_errata_tool')
+def test_list_events_only(mock_clicontext, monkeypatch):
+    runner = CliRunner()
+    ctx = mock_clicontext
+    result = runner.invoke(cli.cmd_event, ['--erratum', '12345'], obj=ctx)
+    assert result.exit_code == 0
+
+    # with --events no Jira jobs should be loaded at all
+    load_jira_jobs = mock.MagicMock(return_value=iter([]))
+    monkeypatch.setattr(cli.CLIContext, 'load_jira_jobs', load_jira_jobs)
+    result = runner.invoke(cli.cmd_list, ['--events'], obj=ctx)
+    assert result.exit_code == 0
+    assert result.output.count('event E: 12345') == 2
+    load_jira_jobs.assert_not_called()
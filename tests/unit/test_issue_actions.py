@@ -0,0 +1,34 @@
+from newa import IssueAction, cli
+
+
+def _ids(actions):
+    return [action.id for action in cli.sort_issue_actions(actions)]
+
+
+def test_sort_issue_actions():
+    # config order is kept when parents already come first
+    actions = [
+        IssueAction(id='epic'),
+        IssueAction(id='task', parent_id='epic'),
+        IssueAction(id='other'),
+        ]
+    assert _ids(actions) == ['epic', 'task', 'other']
+
+    # children defined before their parent follow it
+    actions = [
+        IssueAction(id='subtask', parent_id='task'),
+        IssueAction(id='task', parent_id='epic'),
+        IssueAction(id='other'),
+        IssueAction(id='epic'),
+        ]
+    assert _ids(actions) == ['other', 'epic', 'task', 'subtask']
+
+
+def test_sort_issue_actions_missing_parent():
+    # unknown parents stay in place, parent cycles go last
+    actions = [
+        IssueAction(id='a', parent_id='b'),
+        IssueAction(id='b', parent_id='a'),
+        IssueAction(id='orphan', parent_id='unknown'),
+        ]
+    assert _ids(actions) == ['orphan', 'a', 'b']
@@ -1,3 +1,5 @@
+import pytest
+
 from newa import cli
 
 
@@ -14,3 +16,17 @@ def test_release_mapping():
         ]
     for release, distro in matrix:
         assert cli.apply_release_mapping(release) == distro
+
+
+def test_release_mapping_custom():
+    mapping = ['RHEL-9.4.0.Z.MAIN+EUS=RHEL-9.4.0-Nightly', 'RHEL-9.5.0.Z.MAIN=']
+    assert cli.apply_release_mapping(
+        'RHEL-9.4.0.Z.MAIN+EUS', mapping, regexp=False) == 'RHEL-9.4.0-Nightly'
+    assert cli.apply_release_mapping('RHEL-9.5.0.Z.MAIN', mapping, regexp=False) == ''
+    assert cli.apply_release_mapping('RHEL-9.6.0', mapping, regexp=False) == 'RHEL-9.6.0'
+
+
+def test_parse_release_mapping():
+    assert cli.parse_release_mapping(r'\.GA$=') == (r'\.GA$', '')
+    with pytest.raises(Exception, match='does not having expected format'):
+        cli.parse_release_mapping('no-value-here')
@@ -1,6 +1,6 @@
 import pytest
 
-from newa import render_template
+from newa import DEFAULT_TEMPLATE_ENVIRONMENT, compile_template, render_template
 
 
 @pytest.fixture
@@ -20,3 +20,15 @@ def test_render_template_bad():
         render_template(
             "{% if %} {% ednif %}",
             )
+
+
+def test_compile_template_cached(simple_template):
+    template = compile_template(simple_template, DEFAULT_TEMPLATE_ENVIRONMENT)
+    assert compile_template(simple_template, DEFAULT_TEMPLATE_ENVIRONMENT) is template
+    # cached template still renders with the given variables
+    assert render_template(simple_template, TESTVAR='first').endswith('first')
+    assert render_template(simple_template, TESTVAR='second').endswith('second')
+
+
+def test_render_template_plain():
+    assert render_template("  plain text without markup\n") == "plain text without markup"